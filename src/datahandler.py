@@ -1,8 +1,11 @@
 from object import Object
 from penaltylogic import PenaltyLogic
 from qualitativechoicelogic import QualitativeChoiceLogic
+import numpy as np
 import re
 
+_IF_RE = re.compile(r'\s+IF\s*')  # separates a rule's options from its condition, compiled once
+
 
 class DataHandler:
     """
@@ -12,6 +15,8 @@ class DataHandler:
     - attributes (list): A list containing the values of each attribute of the problem.
     - values (dict): A dictionary that maps each attribute value to a binary value, 1 or 0.
     - objects (list): A list of Object instances.
+    - object_integers (numpy.ndarray): An (N, n) matrix holding each object's integers.
+    - total_penalties (numpy.ndarray): An (N,) array holding each object's total penalty.
     - constraints (list): A list of containing the hard constraints of the problem.
     - penalty_objects (list): A list containing PenaltyLogic instances.
     - qualitative_objects (list): A list containing QualitativeChoiceLogic instances.
@@ -23,7 +28,12 @@ class DataHandler:
         """
         self.attributes = []  # list containing each boolean value of the attribute boolean variable
         self.values = {}  # hash table matching each boolean value with a binary code
+        self._lit_of = {}  # hash table matching each boolean value with its signed pysat literal
+        self._formula_cache = {}  # parsed clause lists keyed by their formula string
         self.objects = []  # list of Object objects
+        self.object_integers = None  # (N, n) int32 matrix of object integers
+        self.total_penalties = None  # (N,) int64 array of total penalties
+        self._encoded_bytes = None  # (N, n) uint8 matrix of ASCII '0'/'1' encodings
         self.constraints = []
         self.penalty_objects = []
         self.qualitative_objects = []
@@ -36,15 +46,15 @@ class DataHandler:
         :return: None.
         """
         with open(filepath, "r") as f:
-            lines = f.readlines()
-            lines = [line.strip() for line in lines]
-            for line in lines:
+            for line in f.read().splitlines():
                 current_line = line.split(": ")
                 category = current_line[0]
                 values = current_line[1].split(", ")
                 self.values[values[0]] = 1
                 self.values[values[1]] = 0
                 self.attributes.append(values)
+                self._lit_of[values[0]] = len(self.attributes)
+                self._lit_of[values[1]] = -len(self.attributes)
 
     def read_constraints(self, filepath):
         """
@@ -55,12 +65,8 @@ class DataHandler:
         :return (list): constraints
         """
         with open(filepath, "r") as f:
-            lines = f.readlines()
-            lines = [line.strip() for line in lines]
-            for line in lines:
-                clause_list = self.make_constraints(line)
-                for clause in clause_list:
-                    self.constraints.append(clause)
+            for line in f.read().splitlines():
+                self.constraints.extend(self.make_constraints(line))
             self.add_base_constraints()
             return self.constraints
 
@@ -73,14 +79,12 @@ class DataHandler:
         :return (list): penalty_objects
         """
         with open(filepath, "r") as f:
-            lines = f.readlines()
-            lines = [line.strip() for line in lines]
-            for line in lines:
+            for line in f.read().splitlines():
                 line_elements = line.split(", ")
                 cnf_formula = line_elements[0]
                 penalty_value = line_elements[1]
                 cnf_constraints = self.make_constraints(cnf_formula)
-                penalty_logic = PenaltyLogic(cnf_formula, cnf_constraints, penalty_value)
+                penalty_logic = PenaltyLogic(cnf_formula, cnf_constraints, int(penalty_value))
                 self.penalty_objects.append(penalty_logic)
         return self.penalty_objects
 
@@ -93,23 +97,13 @@ class DataHandler:
         :return (list): qualitative_objects
         """
         with open(filepath, "r") as f:
-            lines = f.readlines()
-            lines = [line.strip() for line in lines]
-            for line in lines:
-                values = re.split(' IF | IF', line)
-                constraints = []
+            for line in f.read().splitlines():
+                values = _IF_RE.split(line)
                 logic = values[0]
-                condition = values[1]
-                if condition == '':
-                    values.pop(1)
                 condition_constraint = None
-                if len(values) == 2:
-                    condition = values[1]
-                    condition_constraint = self.make_constraints(condition)
-                clauses = logic.split(" BT ")
-                for clause in clauses:
-                    clause_list = self.make_constraints(clause)
-                    constraints.append(clause_list)
+                if len(values) == 2 and values[1]:
+                    condition_constraint = self.make_constraints(values[1])
+                constraints = [self.make_constraints(clause) for clause in logic.split(" BT ")]
                 qualitative_logic = QualitativeChoiceLogic(line, constraints, condition_constraint)
                 self.qualitative_objects.append(qualitative_logic)
         return self.qualitative_objects
@@ -121,113 +115,76 @@ class DataHandler:
 
         :return (list): The list of objects.
         """
-        integer_value = 0
-        num_of_bits = len(self.attributes)
-        num_of_sets = 2 ** num_of_bits
-        while integer_value < num_of_sets:
-            object_number = integer_value
-            object_name = f"o{object_number}"
-            object_values = []
-            object_integers = []
-            encoded_string = self.encode_string(integer_value, num_of_bits)
-            integer = 1
-            for index, item in enumerate(encoded_string):
-                object_integer = integer
-                attribute_variable = self.attributes[index]
-                bit_value = int(item)
-                if bit_value == 0:
-                    target_index = 1
-                    object_integer = -integer
-                else:
-                    target_index = 0
-                attribute_value = attribute_variable[target_index]
-                object_values.append(attribute_value)
-                object_integers.append(object_integer)
-                integer += 1
-            new_object = Object(object_name, encoded_string, object_values, object_integers)
-            self.objects.append(new_object)
-            integer_value += 1
+        self.objects = list(self.iter_objects())
         return self.objects
 
-    def make_constraints(self, line):
+    def iter_objects(self):
         """
-        Given a string representing a logic formula, formats it such that it can be used
-        by pysat.
+        Yields the objects of the problem one at a time, building each Object view
+        on demand from the shared arrays. Streaming consumers that only need a
+        single pass can use this directly without materializing all 2^n objects.
 
-        :param line (str): A string of code representing a logic formula.
-        :return (list): A list holding the formula.
+        :return (generator): A generator of Object instances.
         """
-        clause = []
-        clause_list = []
-        clauses = line.split(" AND ")
-        for a_clause in clauses:
-            clause.clear()
-            literals = a_clause.split(" OR ")
-            if len(literals) == 1:
-                for literal in literals:
-                    attribute_value = literal.split(" ")
-                    if len(attribute_value) == 2:
-                        value = attribute_value[1]
-                        integer = self.return_integer(value)
-                        bit_value = self.values[value]
-                        if bit_value == 1:
-                            integer = -integer
-                        new_clause = [integer]
-                        clause_list.append(new_clause)
-                    else:
-                        value = attribute_value[0]
-                        integer = self.return_integer(value)
-                        bit_value = self.values[value]
-                        if bit_value == 0:
-                            integer = -integer
-                        new_clause = [integer]
-                        clause_list.append(new_clause)
-            else:
-                for literal in literals:
-                    attribute_value = literal.split(" ")
-                    if len(attribute_value) == 2:
-                        value = attribute_value[1]
-                        integer = self.return_integer(value)
-                        bit_value = self.values[value]
-                        if bit_value == 1:
-                            integer = -integer
-                        clause.append(integer)
-                    else:
-                        value = attribute_value[0]
-                        integer = self.return_integer(value)
-                        bit_value = self.values[value]
-                        if bit_value == 0:
-                            integer = -integer
-                        clause.append(integer)
-            if clause:
-                clause_list.append(clause)
-        return clause_list
+        num_of_sets = self._build_object_arrays()
+        for object_number in range(num_of_sets):
+            object_name = f"o{object_number}"
+            encoded_string = self._encoded_bytes[object_number].tobytes().decode('ascii')
+            yield Object(object_name, encoded_string, object_number,
+                         self.object_integers, self.total_penalties, self.attributes)
 
-    def encode_string(self, integer_value, num_of_bits):
+    def _build_object_arrays(self):
         """
-        Given an integer value, converts it to a binary string representation with a specified
-        number of bits.
-        :param integer_value (int): The integer to be converted.
-        :param num_of_bits (int): The desired number of bits.
-        :return (str): The binary string representation of the integer value.
+        Builds the shared per-object arrays (integer matrix, penalty array, and
+        ASCII encoding rows) if they have not been built yet.
+
+        :return (int): The number of objects.
         """
-        encoded_string = (format(integer_value, f'0{num_of_bits}b'))
-        return encoded_string
+        num_of_bits = len(self.attributes)
+        num_of_sets = 2 ** num_of_bits
+        if self.object_integers is None:
+            # enumerate with the narrowest dtype that fits so the whole table stays in cache
+            if num_of_bits <= 8:
+                dtype, width = np.uint8, 1
+            elif num_of_bits <= 16:
+                dtype, width = np.uint16, 2
+            else:
+                dtype, width = np.uint64, 8
+            integer_values = np.arange(num_of_sets, dtype=dtype)
+            bit_matrix = np.unpackbits(integer_values.view(np.uint8).reshape(-1, width)[:, ::-1],
+                                       axis=1)[:, -num_of_bits:]
+            template = np.arange(1, num_of_bits + 1, dtype=np.int32)
+            signs = (bit_matrix.astype(np.int32) << 1) - 1  # bit 0 -> -1, bit 1 -> +1
+            self.object_integers = signs * template
+            self.total_penalties = np.zeros(num_of_sets, dtype=np.int64)
+            # each row becomes the ASCII '0'/'1' string of the object
+            self._encoded_bytes = bit_matrix + ord('0')
+        return num_of_sets
 
-    def return_integer(self, value):
+    def make_constraints(self, line):
         """
-        Retrieves the corresponding integer from the attribute value, so that a formula
-        can be built and evaluated by pysat.
+        Given a string representing a logic formula, formats it such that it can be used
+        by pysat. Repeated formulas are parsed once and served from a cache, so the
+        returned clause lists are shared and must not be mutated by callers.
 
-        :param value (str): The attribute value.
-        :return (int): The integer form of the attribute value.
+        :param line (str): A string of code representing a logic formula.
+        :return (list): A list holding the formula.
         """
-        target_integer = 0
-        for index, item in enumerate(self.attributes, 1):
-            if value in item:
-                target_integer = index
-                break
-        return target_integer
+        cached = self._formula_cache.get(line)
+        if cached is not None:
+            return cached
+        clause_list = []
+        for a_clause in line.split(" AND "):
+            clause = []
+            for literal in a_clause.split(" OR "):
+                attribute_value = literal.split(" ")
+                integer = self._lit_of[attribute_value[-1]]
+                if len(attribute_value) == 2:  # a NOT marker flips the stored literal
+                    integer = -integer
+                clause.append(integer)
+            clause_list.append(clause)
+        self._formula_cache[line] = clause_list
+        return clause_list
 
     def add_base_constraints(self):
         """
@@ -236,10 +193,6 @@ class DataHandler:
         it can be evaluated by pysat.
         :return: None.
         """
-        for index, item in enumerate(self.attributes, 1):
-            base_constraint = []
-            value1 = -index
-            value2 = index
-            base_constraint.append(value1)
-            base_constraint.append(value2)
-            self.constraints.append(base_constraint)
+        # Each [-i, i] clause is a tautology, but it registers attribute variable i
+        # with the solver so that enumerated models cover every attribute.
+        self.constraints.extend([-index, index] for index in range(1, len(self.attributes) + 1))
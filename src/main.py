@@ -10,7 +10,8 @@ objects which are used to process the file data and solve the preference problem
 
 def display_menu(preference_problem):
     """
-    Displays the main menu to the user.
+    Displays the main menu to the user. Choices are dispatched through the
+    HOME_HANDLERS table.
 
     :param preference_problem (PreferenceProblem): The preference problem.
     :return: None.
@@ -19,16 +20,15 @@ def display_menu(preference_problem):
     while flag:
         print_home_screen()
         choice = input("Your Choice: ")
-        match choice:
-            case '1':
-                penalty_logic_menu(preference_problem)
-            case '2':
-                qualitative_choice_logic_menu(preference_problem)
-            case '3':
-                flag = False
-                print("Bye!")
-            case _:
+        if choice == '3':
+            flag = False
+            print("Bye!")
+        else:
+            handler = HOME_HANDLERS.get(choice)
+            if handler is None:
                 print("Invalid Choice! Please try again.")
+            else:
+                handler(preference_problem)
 
 
 def penalty_logic_menu(preference_problem):
@@ -38,25 +38,7 @@ def penalty_logic_menu(preference_problem):
     :param preference_problem (PreferenceProblem): The preference problem.
     :return: None.
     """
-    flag = True
-    while flag:
-        print_preference_options()
-        choice = input("Your Choice: ")
-        match choice:
-            case '1':
-                preference_problem.encoding()
-            case '2':
-                preference_problem.return_feasibility()
-            case '3':
-                preference_problem.print_penalty_table()
-            case '4':
-                preference_problem.penalty_exemplification()
-            case '5':
-                preference_problem.penalty_omni_optimization()
-            case '6':
-                flag = False
-            case _:
-                print("Invalid Choice! Please try again.")
+    preference_menu(preference_problem, PENALTY_HANDLERS)
 
 
 def qualitative_choice_logic_menu(preference_problem):
@@ -66,26 +48,30 @@ def qualitative_choice_logic_menu(preference_problem):
     :param preference_problem (PreferenceProblem): the preference problem.
     :return: None.
     """
+    preference_menu(preference_problem, QUALITATIVE_HANDLERS)
+
+
+def preference_menu(preference_problem, handlers):
+    """
+    Displays a preference logic menu to the user, dispatching each choice
+    through the given handler table.
+
+    :param preference_problem (PreferenceProblem): The preference problem.
+    :param handlers (dict): A table mapping menu choices to callables.
+    :return: None.
+    """
     flag = True
     while flag:
         print_preference_options()
         choice = input("Your Choice: ")
-        match choice:
-            case '1':
-                preference_problem.encoding()
-            case '2':
-                preference_problem.return_feasibility()
-            case '3':
-                preference_problem.print_qualitative_table()
-            case '4':
-                pass
-                preference_problem.qualitative_exemplification()
-            case '5':
-                preference_problem.qualitative_omni_optimization()
-            case '6':
-                flag = False
-            case _:
+        if choice == '6':
+            flag = False
+        else:
+            handler = handlers.get(choice)
+            if handler is None:
                 print("Invalid Choice! Please try again.")
+            else:
+                handler(preference_problem)
 
 
 def new_preference_problem():
@@ -138,6 +124,30 @@ def print_preference_options():
     print("6. Back to previous menu")
 
 
+# dispatch tables built once at import, mapping menu choices to the
+# PreferenceProblem method each one runs
+HOME_HANDLERS = {
+    '1': penalty_logic_menu,
+    '2': qualitative_choice_logic_menu,
+}
+
+PENALTY_HANDLERS = {
+    '1': PreferenceProblem.encoding,
+    '2': PreferenceProblem.return_feasibility,
+    '3': PreferenceProblem.print_penalty_table,
+    '4': PreferenceProblem.penalty_exemplification,
+    '5': PreferenceProblem.penalty_omni_optimization,
+}
+
+QUALITATIVE_HANDLERS = {
+    '1': PreferenceProblem.encoding,
+    '2': PreferenceProblem.return_feasibility,
+    '3': PreferenceProblem.print_qualitative_table,
+    '4': PreferenceProblem.qualitative_exemplification,
+    '5': PreferenceProblem.qualitative_omni_optimization,
+}
+
+
 def main():
     """
     The main method.
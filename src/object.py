@@ -1,58 +1,81 @@
 class Object:
     """
-    This class represents an object in the preference problem.
+    This class represents an object in the preference problem. Each Object is a
+    thin view over the shared per-problem arrays built by DataHandler, rather
+    than owning its own copies of the numeric data.
 
     Attributes:
     - name (str): The name of the object.
     - encoding (str): The binary encoding of the object.
-    - values (list): An arrangement of attributes associated with each object.
-    - integers (list): An integer representation of the values of the object.
-    - total_penalty (int): The total penalty logic penalty associated with this object.
+    - index (int): The row of this object in the shared arrays.
+    - integers (numpy.ndarray): A row view of the shared integer matrix.
     """
-    def __init__(self, name, encoding, values, integers):
+    __slots__ = ('name', 'encoding', 'index', 'integers', '_penalties', '_attribute_pairs', '_lits',
+                 '_integer_list')
+
+    def __init__(self, name, encoding, index, integer_matrix, penalty_array, attribute_pairs):
         """
         Initializes a new Object.
 
         :param name (str): The name of the object.
         :param encoding (str): The binary encoding of the object.
-        :param values (list): An arrangement of attributes associated with each object.
-        :param integers (list): An integer representation of the values of the object.
+        :param index (int): The row of this object in the shared arrays.
+        :param integer_matrix (numpy.ndarray): The shared matrix of object integers.
+        :param penalty_array (numpy.ndarray): The shared array of total penalties.
+        :param attribute_pairs (list): The shared (n, 2) table of attribute values.
         """
         self.name = name
         self.encoding = encoding
-        self.values = values
-        self.integers = integers
-        self.total_penalty = 0
+        self.index = index
+        self.integers = integer_matrix[index]
+        self._penalties = penalty_array
+        self._attribute_pairs = attribute_pairs
+        self._lits = None
+        self._integer_list = None
 
     def __str__(self):
         """
-        Prints the values of the objects as a string.
+        Returns the object and its values as a string. The values are derived on
+        demand from the encoding and the shared attribute table rather than being
+        stored per object.
 
-        :return: None.
+        :return (str): The object rendered as "name - value, value, ...".
+        """
+        output_string = ", ".join(self.return_values())
+        return f"{self.name} - {output_string}"
+
+    def return_values(self):
+        """
+        Returns the arrangement of attribute values associated with this object,
+        materialized from the binary encoding.
+
+        :return (list): The attribute values of this object.
         """
-        output_string = ", ".join(self.values)
-        print(self.name + f" - {output_string}")
+        return [self._attribute_pairs[index][1 - int(bit)] for index, bit in enumerate(self.encoding)]
 
     def return_integer_values(self):
         """
-        Returns the list of integer values associated with this object.
+        Returns the list of integer values associated with this object, converted
+        from the shared matrix row once and cached. Callers pass the list to the
+        solver as assumptions, so it must not be mutated.
 
         :return (list): integers.
         """
-        return self.integers
+        if self._integer_list is None:
+            self._integer_list = self.integers.tolist()
+        return self._integer_list
 
-    def return_test_integers(self):
+    def return_literal_set(self):
         """
-        Returns the object's list of integers in a format such that the object can
-        be used in pysat.
+        Returns this object's integers as a frozenset, built once and cached.
+        An object is a complete assignment, so a clause holds for it exactly
+        when one of the clause's literals is in this set.
 
-        :return (list): test_list
+        :return (frozenset): The signed literals of this object.
         """
-        test_list = []
-        for integer in self.integers:
-            test_int = [integer]
-            test_list.append(test_int)
-        return test_list
+        if self._lits is None:
+            self._lits = frozenset(self.return_integer_values())
+        return self._lits
 
     def add_penalty(self, penalty):
         """
@@ -61,14 +84,14 @@ class Object:
         :param penalty (int): the penalty to be added to this object's total penalty.
         :return: None.
         """
-        self.total_penalty += int(penalty)
+        self._penalties[self.index] += penalty
 
     def get_total_penalty(self):
         """
         Returns this object's total penalty to caller.
         :return (int): total_penalty
         """
-        return self.total_penalty
+        return int(self._penalties[self.index])
 
     def get_name(self):
         """
@@ -1,10 +1,9 @@
-from pysat.formula import CNF
-from pysat.solvers import Solver
-
-
 class PenaltyLogic:
     """
-    This class represents an instance of a penalty logic rule.
+    This class represents an instance of a penalty logic rule. A rule does not
+    own a solver; it is attached to the preference problem's shared solver,
+    with its clauses guarded by a selector literal so that the rule is only
+    active when its selector is assumed.
 
     Attributes:
     - name (str): The name of the rule as a string.
@@ -22,26 +21,59 @@ class PenaltyLogic:
         self.name = name
         self.constraint = constraint
         self.penalty = penalty
+        self._solver = None
+        self._selector = None
+        self._status = None
+
+    def attach_to(self, solver, selector):
+        """
+        Attaches this rule to a shared solver. Each clause is added with the
+        negated selector literal, so the clauses only bind when the selector
+        is passed as an assumption.
+
+        :param solver (Solver): The shared solver to attach to.
+        :param selector (int): The selector literal assigned to this rule.
+        :return: None.
+        """
+        self._solver = solver
+        self._selector = selector
+        for clause in self.constraint:
+            solver.add_clause(list(clause) + [-selector])
+        self._status = self.precheck()
 
-    def test(self, test_object):
+    def precheck(self):
         """
-        Applies penalty logic rule on feasible object test_object.
+        Classifies this rule against the hard constraints before any object is
+        tested. A rule that is inconsistent with the hard constraints is violated
+        by every feasible object, and a rule entailed by them is satisfied by
+        every feasible object; either way the per-object solves can be skipped.
+
+        :return (str): 'violated', 'satisfied', or None when the rule must be
+            tested per object.
+        """
+        if not self._solver.solve(assumptions=[self._selector]):
+            return 'violated'
+        for clause in self.constraint:
+            if self._solver.solve(assumptions=[-literal for literal in clause]):
+                return None
+        return 'satisfied'
+
+    def violates(self, test_object):
+        """
+        Checks whether feasible object test_object violates this rule. An object
+        is a complete assignment, so after the precheck shortcuts the rule is
+        evaluated directly by set membership over the object's literals instead
+        of a solver call. Accumulating the penalty is left to the caller.
+
         :param test_object (Object): The feasible object being tested.
-        :return (int): The penalty applied to test_object.
-        """
-        test_formula = self.constraint.copy()
-        penalty = self.penalty
-        object_test_integers = test_object.return_test_integers()
-        for obj_integer in object_test_integers:
-            test_formula.append(obj_integer)
-        cnf = CNF(from_clauses=test_formula)
-        with Solver(bootstrap_with=cnf) as solver:
-            if solver.solve():
-                penalty = 0
-                test_object.add_penalty(penalty)
-            else:
-                test_object.add_penalty(penalty)
-        return penalty
+        :return (bool): True when the object violates the rule, False otherwise.
+        """
+        if self._status == 'satisfied':
+            return False
+        if self._status == 'violated':
+            return True
+        lits = test_object.return_literal_set()
+        return not all(any(literal in lits for literal in clause) for clause in self.constraint)
 
     def get_name(self):
         """
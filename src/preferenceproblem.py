@@ -1,7 +1,108 @@
 from pysat.formula import CNF
 from pysat.solvers import Solver
 from prettytable import PrettyTable
+from qualitativechoicelogic import QualitativeChoiceLogic
 from random import sample
+from multiprocessing import Pool, cpu_count
+from itertools import chain
+from functools import cached_property
+import numpy as np
+
+try:  # numba is optional; without it the dominance test falls back to NumPy
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
+# below this many objects the cube split costs more than serial enumeration saves
+_PARALLEL_FEASIBILITY_THRESHOLD = 2 ** 12
+
+# below this many feasible objects the worker solvers cost more than they save
+_PARALLEL_QUALITATIVE_THRESHOLD = 2 ** 12
+
+# per-worker qualitative rules, built once by the pool initializer
+_worker_rules = None
+
+# valid-model sets keyed by normalized hard constraints, shared across problems
+_model_cache = {}
+
+
+def _dominated_mask(matrix):
+    """
+    Returns a boolean mask marking each row of the satisfaction-degree matrix
+    that is Pareto-dominated by some other row. Pure NumPy fallback; replaced
+    by a compiled kernel when numba is installed.
+
+    :param matrix (numpy.ndarray): The (N, K) satisfaction-degree matrix.
+    :return (numpy.ndarray): An (N,) boolean mask of dominated rows.
+    """
+    less_equal = (matrix[None, :, :] <= matrix[:, None, :]).all(axis=2)
+    strictly_less = (matrix[None, :, :] < matrix[:, None, :]).any(axis=2)
+    return (less_equal & strictly_less).any(axis=1)
+
+
+if njit is not None:
+    @njit(cache=True, parallel=True)
+    def _dominated_mask(matrix):  # noqa: F811 - compiled replacement of the fallback
+        num_rows, num_rules = matrix.shape
+        dominated = np.zeros(num_rows, dtype=np.bool_)
+        for i in prange(num_rows):
+            for j in range(num_rows):
+                less_equal = True
+                strictly_less = False
+                for k in range(num_rules):
+                    if matrix[j, k] > matrix[i, k]:
+                        less_equal = False
+                        break
+                    if matrix[j, k] < matrix[i, k]:
+                        strictly_less = True
+                if less_equal and strictly_less:
+                    dominated[i] = True
+                    break
+        return dominated
+
+
+def _init_qualitative_worker(hard_constraints, rule_specs, num_attributes):
+    """
+    Builds this worker's shared solver and attaches a fresh copy of every
+    qualitative rule to it. Runs once per worker process; solvers cannot be
+    pickled, so each worker reconstructs its own from the raw clause lists.
+
+    :param hard_constraints (list): The hard constraint clauses.
+    :param rule_specs (list): (name, constraints, condition) per qualitative rule.
+    :param num_attributes (int): The number of attribute variables.
+    :return: None.
+    """
+    global _worker_rules
+    solver = Solver(name='g3', bootstrap_with=CNF(from_clauses=hard_constraints))
+    next_selector = iter(range(num_attributes + 1, num_attributes + 1 + 10 ** 9))
+    _worker_rules = []
+    for name, constraints, condition in rule_specs:
+        rule = QualitativeChoiceLogic(name, constraints, condition)
+        rule.attach_to(solver, lambda: next(next_selector))
+        _worker_rules.append(rule)
+
+
+def _evaluate_qualitative(assumptions):
+    """
+    Evaluates every qualitative rule for one object in a worker process.
+
+    :param assumptions (list): The object's signed literals.
+    :return (list): The object's satisfaction degrees, one per rule.
+    """
+    return [rule.degree(assumptions) for rule in _worker_rules]
+
+
+def _enumerate_models(hard_constraints, cube):
+    """
+    Enumerates the models of the hard constraints under the given cube of fixed
+    literals. Runs in a worker process, so it builds its own solver.
+
+    :param hard_constraints (list): The hard constraint clauses.
+    :param cube (list): The literals fixed for this worker's share of the space.
+    :return (list): The models found, as tuples.
+    """
+    with Solver(bootstrap_with=CNF(from_clauses=hard_constraints)) as solver:
+        return [tuple(m) for m in solver.enum_models(assumptions=cube)]
 
 
 class PreferenceProblem:
@@ -33,11 +134,38 @@ class PreferenceProblem:
         self.hard_constraints = hard_constraints
         self.penalty_logics = penalty_logics
         self.qualitative_logics = qualitative_logics
-        self.object_qualitative_values = {}
         self.feasible_objects = []
+        self._solver = Solver(name='g3', bootstrap_with=CNF(from_clauses=hard_constraints))
+        self._next_selector = len(objects[0].integers) + 1 if objects else 1
+        for penalty_logic in self.penalty_logics:
+            penalty_logic.attach_to(self._solver, self._new_selector())
+        for qualitative_logic in self.qualitative_logics:
+            qualitative_logic.attach_to(self._solver, self._new_selector)
         self.check_feasibility()
-        self.penalty_logic_table = self.apply_penalty_logic()
-        self.qualitative_choice_table = self.apply_qualitative_choice_logic()
+        self.apply_penalty_logic()
+        self.apply_qualitative_choice_logic()
+
+    def _new_selector(self):
+        """
+        Returns a fresh selector literal, above the attribute variables and any
+        selector handed out before it.
+
+        :return (int): The selector literal.
+        """
+        selector = self._next_selector
+        self._next_selector += 1
+        return selector
+
+    def __del__(self):
+        """
+        Releases the shared solver when the problem is garbage collected.
+
+        :return: None.
+        """
+        solver = getattr(self, '_solver', None)
+        if solver is not None:
+            solver.delete()
+            self._solver = None
 
     def encoding(self):
         """
@@ -46,22 +174,43 @@ class PreferenceProblem:
         :return: None.
         """
         for obj in self.objects:
-            obj.__str__()
+            print(obj)
 
     def check_feasibility(self):
         """
-        Calculates the number of feasible objects.
+        Calculates the number of feasible objects. The valid-model set is cached
+        at module level keyed by the normalized hard constraints, so constructing
+        another problem over the same constraints skips the solver entirely.
+        Large problems split the model enumeration into cubes over the first
+        attribute variables and solve the cubes in a process pool; the cubes
+        partition the space, so their model sets merge without overlap.
 
         :return: None.
         """
-        valid_objects = []
-        cnf = CNF(from_clauses=self.hard_constraints)
-        with Solver(bootstrap_with=cnf) as solver:
-            for m in solver.enum_models():
-                valid_objects.append(m)
+        cache_key = frozenset(frozenset(clause) for clause in self.hard_constraints)
+        valid_objects = _model_cache.get(cache_key)
+        if valid_objects is not None:
             for obj in self.objects:
-                if obj.return_integer_values() in valid_objects:
+                if tuple(obj.return_integer_values()) in valid_objects:
                     self.feasible_objects.append(obj)
+            return
+        num_attributes = len(self.objects[0].integers) if self.objects else 0
+        workers = cpu_count()
+        if len(self.objects) >= _PARALLEL_FEASIBILITY_THRESHOLD and workers > 1:
+            cube_bits = min(max(workers - 1, 1).bit_length(), num_attributes)
+            cubes = [[variable if (code >> (variable - 1)) & 1 else -variable
+                      for variable in range(1, cube_bits + 1)]
+                     for code in range(2 ** cube_bits)]
+            with Pool(min(workers, len(cubes))) as pool:
+                model_lists = pool.starmap(_enumerate_models,
+                                           [(self.hard_constraints, cube) for cube in cubes])
+            valid_objects = set(chain.from_iterable(model_lists))
+        else:
+            valid_objects = set(_enumerate_models(self.hard_constraints, []))
+        _model_cache[cache_key] = valid_objects
+        for obj in self.objects:
+            if tuple(obj.return_integer_values()) in valid_objects:
+                self.feasible_objects.append(obj)
 
     def return_feasibility(self):
         """
@@ -77,43 +226,90 @@ class PreferenceProblem:
 
     def apply_penalty_logic(self):
         """
-        Applies penalty logic on the feasible objects of the problem, and creates the
-        penalty logic table.
+        Applies penalty logic on the feasible objects of the problem. Rule
+        violations are gathered into a boolean matrix and the total penalties fall
+        out of a single matrix-vector product; the table itself is rendered lazily
+        by penalty_logic_table.
+
+        :return: None.
+        """
+        violates = np.zeros((len(self.penalty_logics), len(self.feasible_objects)), dtype=bool)
+        for rule_number, penalty_logic in enumerate(self.penalty_logics):
+            violates[rule_number] = [penalty_logic.violates(obj) for obj in self.feasible_objects]
+        penalty_values = np.array([penalty_logic.penalty for penalty_logic in self.penalty_logics],
+                                  dtype=np.int64)
+        self._penalty_matrix = violates * penalty_values[:, None]
+        self._penalty_arr = violates.T.astype(np.int64) @ penalty_values
+        self._names = [obj.get_name() for obj in self.feasible_objects]
+        for index, obj in enumerate(self.feasible_objects):
+            obj.add_penalty(int(self._penalty_arr[index]))
+
+    @cached_property
+    def penalty_logic_table(self):
+        """
+        The penalty logic PrettyTable, built from the stored penalty matrix the
+        first time it is needed.
 
         :return (PrettyTable): The penalty logic table.
         """
         columns = self.make_penalty_table_columns()
         my_table = PrettyTable(columns)
-        for obj in self.feasible_objects:
-            row = [obj.get_name()]
-            for penalty_logic in self.penalty_logics:
-                penalty = penalty_logic.test(obj)
-                row.append(penalty)
-            row.append(obj.get_total_penalty())
-            my_table.add_row(row)
+        penalty_columns = self._penalty_matrix.T.tolist()
+        totals = self._penalty_arr.tolist()
+        my_table.add_rows([[name, *penalties, total]
+                           for name, penalties, total in zip(self._names, penalty_columns, totals)])
         return my_table
 
     def apply_qualitative_choice_logic(self):
         """
-        Applies qualitative choice logic on the feasible objects of the problem, and
-        creates the qualitative choice logic table.
+        Applies qualitative choice logic on the feasible objects of the problem,
+        storing the satisfaction degrees; the table itself is rendered lazily by
+        qualitative_choice_table. Objects are independent, so large problems fan
+        the per-object evaluation out to a process pool whose workers each hold
+        their own copy of the rules and solver.
+
+        :return: None.
+        """
+        if (len(self.feasible_objects) >= _PARALLEL_QUALITATIVE_THRESHOLD
+                and cpu_count() > 1 and self.qualitative_logics):
+            rule_specs = [(rule.name, rule.constraints, rule.condition)
+                          for rule in self.qualitative_logics]
+            num_attributes = len(self.objects[0].integers)
+            assumption_lists = [obj.return_integer_values() for obj in self.feasible_objects]
+            with Pool(initializer=_init_qualitative_worker,
+                      initargs=(self.hard_constraints, rule_specs, num_attributes)) as pool:
+                qualitative_rows = pool.map(_evaluate_qualitative, assumption_lists)
+        else:
+            qualitative_rows = [[qualitative_logic.test(obj)
+                                 for qualitative_logic in self.qualitative_logics]
+                                for obj in self.feasible_objects]
+        self._qual_display_rows = [[obj.get_name()] + row
+                                   for obj, row in zip(self.feasible_objects, qualitative_rows)]
+        # inf marks an unsatisfied rule; IEEE comparisons order it after every degree
+        self._qual_matrix = np.array(qualitative_rows, dtype=np.float32).reshape(
+            len(qualitative_rows), len(self.qualitative_logics))
+
+    @property
+    def object_qualitative_values(self):
+        """
+        The satisfaction degrees keyed by object name, sliced lazily from the
+        degree matrix. Kept for compatibility; new code should index the matrix.
+
+        :return (dict): The satisfaction degrees of each feasible object.
+        """
+        return {name: self._qual_matrix[index].tolist() for index, name in enumerate(self._names)}
+
+    @cached_property
+    def qualitative_choice_table(self):
+        """
+        The qualitative choice logic PrettyTable, built from the stored
+        satisfaction degrees the first time it is needed.
 
         :return (PrettyTable): The qualitative choice logic table.
         """
         columns = self.make_qualitative_table_columns()
         my_table = PrettyTable(columns)
-        infinity = float('inf')
-        for obj in self.feasible_objects:
-            row = [obj.get_name()]
-            qualitative_values = []
-            for qualitative_logic in self.qualitative_logics:
-                value = qualitative_logic.test(obj)
-                row.append(value)
-                if value == infinity:
-                    value = 10000  # finite number to represent infinity, so that optimal objects can be found
-                qualitative_values.append(value)
-            my_table.add_row(row)
-            self.object_qualitative_values[obj.get_name()] = qualitative_values
+        my_table.add_rows(self._qual_display_rows)
         return my_table
 
     def penalty_exemplification(self):
@@ -123,32 +319,33 @@ class PreferenceProblem:
 
         :return: None.
         """
-        random_feasible_objects = sample(self.feasible_objects, 2)
-        object_one = random_feasible_objects[0]
-        object_two = random_feasible_objects[1]
-        object_one_penalty = object_one.get_total_penalty()
-        object_two_penalty = object_two.get_total_penalty()
-        print(f"Two randomly selected feasible objects are {object_one.get_name()} and {object_two.get_name()},")
+        index_one, index_two = sample(range(len(self.feasible_objects)), 2)
+        name_one = self._names[index_one]
+        name_two = self._names[index_two]
+        object_one_penalty = self._penalty_arr[index_one]
+        object_two_penalty = self._penalty_arr[index_two]
+        print(f"Two randomly selected feasible objects are {name_one} and {name_two},")
         if object_one_penalty > object_two_penalty:
-            print(f"and {object_two.get_name()} is strictly preferred over {object_one.get_name()}.")
+            print(f"and {name_two} is strictly preferred over {name_one}.")
         elif object_two_penalty > object_one_penalty:
-            print(f"and {object_one.get_name()} is strictly preferred over {object_two.get_name()}.")
+            print(f"and {name_one} is strictly preferred over {name_two}.")
         else:
-            print(f"{object_one.get_name()} and {object_two.get_name()} are equivalent.")
+            print(f"{name_one} and {name_two} are equivalent.")
 
     def penalty_omni_optimization(self):
         """
         Calculates all optimal, feasible objects according to the penalty logic of
-        the problem, and displays them to the user.
+        the problem, and displays them to the user. Under penalty semantics an
+        object is optimal exactly when its total penalty is the minimum, so the
+        search is a single min plus an equality mask over the penalty array.
 
         :return: None.
         """
         optimal_objects = []
-
-        for obj in self.feasible_objects:
-            if self.is_optimal_penalty_object(obj):
-                optimal_objects.append(obj.get_name())
-
+        if self._penalty_arr.size:
+            minimum_penalty = self._penalty_arr.min()
+            optimal_objects = [self._names[index]
+                               for index in np.flatnonzero(self._penalty_arr == minimum_penalty)]
         output_string = ", ".join(optimal_objects)
         print(f"All optimal objects: {output_string}")
 
@@ -183,58 +380,38 @@ class PreferenceProblem:
 
         :return: None.
         """
-        random_feasible_objects = sample(self.feasible_objects, 2)
-        object_one = random_feasible_objects[0]
-        object_two = random_feasible_objects[1]
-        object_one_satisfaction_degrees = []
-        object_two_satisfaction_degrees = []
-        satisfaction_comparison = []
-        print(f"Two randomly selected feasible objects are {object_one.get_name()} and {object_two.get_name()},")
-
-        for key in self.object_qualitative_values:
-            if key == object_one.get_name():
-                object_one_satisfaction_degrees = self.object_qualitative_values[key].copy()
-            elif key == object_two.get_name():
-                object_two_satisfaction_degrees = self.object_qualitative_values[key].copy()
-
-        for index, object_one_degree in enumerate(object_one_satisfaction_degrees):
-            object_two_degree = object_two_satisfaction_degrees[index]
-            if object_one_degree <= object_two_degree and object_one_degree < object_two_degree:
-                satisfaction_comparison.append(1)
-            elif object_one_degree >= object_two_degree and object_one_degree > object_two_degree:
-                satisfaction_comparison.append(2)
-            else:
-                satisfaction_comparison.append(0)
-
-        if 1 in satisfaction_comparison:
-            if 2 in satisfaction_comparison:
-                print(f"and {object_one.get_name()} and {object_two.get_name()} are incomparable.")
-            else:
-                print(f"and {object_one.get_name()} is strictly preferred over {object_two.get_name()}.")
-        elif 2 in satisfaction_comparison:
-            if 1 in satisfaction_comparison:
-                print(f"and {object_one.get_name()} and {object_two.get_name()} are incomparable.")
-            else:
-                print(f"and {object_two.get_name()} is strictly preferred over {object_one.get_name()}.")
+        index_one, index_two = sample(range(len(self.feasible_objects)), 2)
+        name_one = self._names[index_one]
+        name_two = self._names[index_two]
+        print(f"Two randomly selected feasible objects are {name_one} and {name_two},")
+
+        object_one_degrees = self._qual_matrix[index_one]
+        object_two_degrees = self._qual_matrix[index_two]
+
+        # a lower satisfaction degree is better; direct comparisons keep inf well-defined
+        object_one_better = bool((object_one_degrees < object_two_degrees).any())
+        object_two_better = bool((object_two_degrees < object_one_degrees).any())
+
+        if object_one_better and object_two_better:
+            print(f"and {name_one} and {name_two} are incomparable.")
+        elif object_one_better:
+            print(f"and {name_one} is strictly preferred over {name_two}.")
+        elif object_two_better:
+            print(f"and {name_two} is strictly preferred over {name_one}.")
         else:
-            print(f"and {object_one.get_name()} and {object_two.get_name()} are equal.")
+            print(f"and {name_one} and {name_two} are equal.")
 
     def qualitative_omni_optimization(self):
         """
         Calculates all optimal, feasible objects according to the qualitative choice
-        logic of the problem, and displays them to the user.
+        logic of the problem, and displays them to the user. An object is optimal
+        when no other object dominates it; the dominance test runs as a compiled
+        kernel when numba is installed and as a broadcast comparison otherwise.
 
         :return: None.
         """
-        preference_degrees = []
-        optimal_objects = []
-
-        # store each preference degree in a list
-        for key in self.object_qualitative_values:
-            obj = self.object_qualitative_values[key].copy()
-            if self.is_optimal_qualitative_object(obj):
-                optimal_objects.append(key)
-
+        dominated = _dominated_mask(self._qual_matrix)
+        optimal_objects = [self._names[index] for index in np.flatnonzero(~dominated)]
         output_string = ", ".join(optimal_objects)
         print(f"All optimal objects: {output_string}")
 
@@ -257,56 +434,13 @@ class PreferenceProblem:
     def is_optimal_qualitative_object(self, obj1):
         """
         Checks if the feasible object meets the criteria for an optimal object
-        according to the qualitative choice logic rules of the problem.
-
-        :param obj1 (Object): The feasible object in consideration.
-        :return (Boolean): True if optimal, False otherwise.
-        """
-        is_optimal = True
-        for key in self.object_qualitative_values:  # loop through object list to find optimal objects
-            obj2 = self.object_qualitative_values[key].copy()
-
-            satisfaction_comparison = []
-
-            for index, object_one_degree in enumerate(obj1):  # compare objects
-                object_two_degree = obj2[index]
-                if object_one_degree <= object_two_degree and object_one_degree < object_two_degree:
-                    satisfaction_comparison.append(1)
-                elif object_one_degree >= object_two_degree and object_one_degree > object_two_degree:
-                    satisfaction_comparison.append(2)
-                else:
-                    satisfaction_comparison.append(0)
-
-            if 1 in satisfaction_comparison:
-                if 2 in satisfaction_comparison:
-                    continue  # objects are incomparable, skip
-                else:
-                    continue  # obj1 is preferred over obj2, skip
-            elif 2 in satisfaction_comparison:
-                if 1 in satisfaction_comparison:
-                    continue  # objects are incomparable, skip
-                else:
-                    is_optimal = False  # obj1 is not optimal, return false and break
-                    break
-            else:
-                continue  # objs are equal, skip
-        return is_optimal
-
-    def is_optimal_penalty_object(self, obj1):
-        """
-        Checks if the feasible object meets the criteria for an optimal object
-        according to the penalty logic rules of the problem.
+        according to the qualitative choice logic rules of the problem. The object
+        is compared against every row of the satisfaction-degree matrix at once.
 
-        :param obj1 (Object): The feasible object in consideration.
+        :param obj1 (list): The satisfaction degrees of the object in consideration.
         :return (Boolean): True if optimal, False otherwise.
         """
-        is_optimal = True
-        for obj2 in self.feasible_objects:
-            if obj1.get_total_penalty() == obj2.get_total_penalty():  # objs are equal, skip
-                continue
-            elif obj1.get_total_penalty() < obj2.get_total_penalty():  # obj1 is strictly preferred, skip
-                continue
-            else:  # obj1 is not optimal, set is_optimal to False and break out of loop
-                is_optimal = False
-                break
-        return is_optimal
+        degrees = np.asarray(obj1, dtype=self._qual_matrix.dtype)
+        dominated = ((self._qual_matrix <= degrees).all(axis=1)
+                     & (self._qual_matrix < degrees).any(axis=1)).any()
+        return not dominated
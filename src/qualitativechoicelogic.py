@@ -1,10 +1,9 @@
-from pysat.formula import CNF
-from pysat.solvers import Solver
-
-
 class QualitativeChoiceLogic:
     """
     This class represents an instance of a Qualitative Choice logic rule from theory T.
+    A rule does not own a solver; it is attached to the preference problem's shared
+    solver, with each option and the condition guarded by their own selector
+    literals so that only the queried part of the rule is active at a time.
 
     Attributes:
     - name (str): The name of the rule.
@@ -23,6 +22,30 @@ class QualitativeChoiceLogic:
         self.name = name
         self.constraints = constraints
         self.condition = condition
+        self._solver = None
+        self._option_selectors = []
+        self._condition_selector = None
+
+    def attach_to(self, solver, new_selector):
+        """
+        Attaches this rule to a shared solver. Each option's clauses are added
+        with the negation of that option's selector literal, and likewise for
+        the condition, so each part only binds when its selector is assumed.
+
+        :param solver (Solver): The shared solver to attach to.
+        :param new_selector (callable): Returns a fresh selector literal per call.
+        :return: None.
+        """
+        self._solver = solver
+        for option in self.constraints:
+            selector = new_selector()
+            self._option_selectors.append(selector)
+            for clause in option:
+                solver.add_clause(list(clause) + [-selector])
+        if self.condition is not None:
+            self._condition_selector = new_selector()
+            for clause in self.condition:
+                solver.add_clause(list(clause) + [-self._condition_selector])
 
     def test(self, test_object):
         """
@@ -31,59 +54,27 @@ class QualitativeChoiceLogic:
         :param test_object (Object): The feasible object being tested.
         :return (int): The satisfaction degree of logic rule for feasible object test_object.
         """
-        logic_values = {}
-        true_logics = []
-        condition_value = False
-        pysat_formulas = []
-        condition_formula = self.condition
-        logics = self.constraints.copy()
-        object_test_integers = test_object.return_test_integers()
-        inf = float('inf')
-
-        for logic in logics:
-            formula = logic.copy()
-            for test_integer in object_test_integers:
-                formula.append(test_integer)
-            pysat_formulas.append(formula)
-
-        if condition_formula is not None:
-            test_condition = condition_formula.copy()
-            for test_integer in object_test_integers:
-                test_condition.append(test_integer)
-            cnf = CNF(from_clauses=test_condition)
-            with Solver(bootstrap_with=cnf) as solver:
-                if solver.solve():
-                    condition_value = True
+        return self.degree(test_object.return_integer_values())
 
-        for index, pysat_formula in enumerate(pysat_formulas, 1):  # test each logic and store as true or false
-            cnf = CNF(from_clauses=pysat_formula)
-            with Solver(bootstrap_with=cnf) as solver:
-                if solver.solve():
-                    value = True
-                    logic_values[index] = value
-                else:
-                    value = False
-                    logic_values[index] = value
+    def degree(self, assumptions):
+        """
+        Returns the satisfaction degree for an object given as its assumption
+        literals. The assumptions and the relevant selector go to the shared
+        solver, so no CNF or solver is rebuilt between objects. Options are
+        tried in order and the first satisfied one is the degree, so later
+        options are never solved. The rule must have been attached to a solver first.
 
-        for key in logic_values:
-            if logic_values[key]:
-                true_logics.append(key)
+        :param assumptions (list): The object's signed literals.
+        :return (int): The satisfaction degree for the given assumptions.
+        """
+        if (self._condition_selector is not None
+                and not self._solver.solve(assumptions=assumptions + [self._condition_selector])):
+            return float('inf')
 
-        if condition_value:
-            if true_logics:
-                minimum = min(true_logics)
-                return minimum
-            else:
-                return inf
-        else:
-            if condition_formula is not None:
-                return inf
-            else:
-                if true_logics:
-                    minimum = min(true_logics)
-                    return minimum
-                else:
-                    return inf
+        for index, selector in enumerate(self._option_selectors, 1):
+            if self._solver.solve(assumptions=assumptions + [selector]):
+                return index
+        return float('inf')
 
     def get_name(self):
         """